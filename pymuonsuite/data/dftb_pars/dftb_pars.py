@@ -1,9 +1,11 @@
 import os
 import json
-import glob
-from copy import deepcopy
+from functools import lru_cache
+from collections.abc import Mapping
 
-# Upon loading, print a message for the user
+_here = os.path.dirname(os.path.abspath(__file__))
+
+# The first time a parameter set is used, print a message for the user
 _references_msg = """
 This calculation makes use of the DFTB parametrisations found at
 
@@ -40,13 +42,42 @@ def print_references():
 
 
 def get_license():
-    return open(os.path.join(os.path.split(__file__)[0], "LICENSE")).read()
+    return open(os.path.join(_here, "LICENSE")).read()
+
+
+_references_printed = False
+
+
+def _print_references_once():
+    global _references_printed
+    if not _references_printed:
+        print_references()
+        _references_printed = True
+
 
+@lru_cache(maxsize=None)
+def _load_json(path, mtime):
+    # mtime is only part of the key, so that edited files get re-read
+    with open(path) as json_file:
+        return json.load(json_file)
 
-print_references()  # Print whenever it gets loaded
+
+def _load_json_cached(path):
+    """Load a JSON file, reusing the parsed result while it is unchanged.
+
+    The returned dictionary is shared between callers and must not be
+    modified in place.
+    """
+    path = os.path.abspath(path)
+    return _load_json(path, os.stat(path).st_mtime)
 
 
 def parse_params(dir):
+    """Parse a parametrisation set folder.
+
+    Returns a tuple with the default arguments of the set (from args.json)
+    and a sorted list of the paths of its optional .json argument files.
+    """
     name = dir.split(os.sep)[-2]
     # Start by defining the Slater Koster path:
     args = {
@@ -55,21 +86,59 @@ def parse_params(dir):
         )
         + os.sep
     }
+    optional = []
 
-    # Try loading any additional arguments
-    try:
-        with open(os.path.join(dir, "args.json")) as args_file:
-            args.update(json.load(args_file))
-    except IOError:
-        pass
+    # Load any additional arguments, and find the optional ones, in one pass
+    with os.scandir(dir) as entries:
+        for e in entries:
+            if e.name == "args.json":
+                args.update(_load_json_cached(e.path))
+            elif e.name.endswith(".json"):
+                optional.append(e.path)
 
-    return args
+    return args, sorted(optional)
 
 
-parameter_sets = {
-    d.split(os.sep)[-2]: parse_params(d)
-    for d in glob.glob(os.path.join(os.path.dirname(__file__), "*/"))
-}
+class _ParameterSets(Mapping):
+    """Read-only mapping of the parameter sets found in a folder, with values
+    as returned by parse_params.
+
+    Subfolders are only listed, and their arguments only parsed, the first
+    time they are needed.
+    """
+
+    def __init__(self, path):
+        self._path = path
+        self._names = None
+        self._sets = {}
+
+    def _list_names(self):
+        if self._names is None:
+            with os.scandir(self._path) as entries:
+                self._names = sorted(
+                    e.name
+                    for e in entries
+                    if e.is_dir()
+                    and not e.name.startswith(".")
+                    and e.name != "__pycache__"
+                )
+        return self._names
+
+    def __getitem__(self, name):
+        if name not in self._sets:
+            if name not in self._list_names():
+                raise KeyError(name)
+            self._sets[name] = parse_params(os.path.join(self._path, name, ""))
+        return self._sets[name]
+
+    def __iter__(self):
+        return iter(self._list_names())
+
+    def __len__(self):
+        return len(self._list_names())
+
+
+parameter_sets = _ParameterSets(_here)
 
 
 class DFTBArgs(object):
@@ -82,21 +151,17 @@ class DFTBArgs(object):
         """Initialise a DFTBArgs object
 
         Initialise a DFTBArgs object given the name of a parametrisation set
-        of choice.
+        of choice. The first one created prints the references and license
+        information for the parametrisations.
 
         Arguments:
             name {str} -- Name of chosen parametrisation set. Currently
                           acceptable values are 3ob-3-1, pbc-0-3.
         """
         self._name = name
-        self._args = parameter_sets[name]
-        self._path = os.path.join(os.path.dirname(__file__), name)
-
-        self._optional = [
-            f
-            for f in glob.glob(os.path.join(self._path, "*.json"))
-            if os.path.basename(f) != "args.json"
-        ]
+        self._args, self._optional = parameter_sets[name]
+        _print_references_once()
+        self._path = os.path.join(_here, name)
 
         self._optdict = {os.path.basename(f): False for f in self._optional}
 
@@ -107,12 +172,12 @@ class DFTBArgs(object):
     @property
     def args(self):
 
-        args = deepcopy(self._args)
+        # Values are all JSON scalars, so a shallow copy is enough
+        args = dict(self._args)
 
         for name, value in self._optdict.items():
             if value:
-                with open(os.path.join(self._path, name)) as json_file:
-                    args.update(json.load(json_file))
+                args.update(_load_json_cached(os.path.join(self._path, name)))
 
         return args
 
@@ -138,24 +138,18 @@ class ReadWriteCastep(ReadWrite):
                 sname = seedname(glob.glob(os.path.join(folder, "*.phonon"))[0])
             # Convert frequencies back to cm-1
             pd.frequencies_unit = "1/cm"
-            # Get phonon frequencies+modes
-            evals = np.array(pd.frequencies.magnitude)
-            evecs = np.array(pd.eigenvectors)
 
             # Only grab the gamma point!
-            gamma_i = None
-            for i, q in enumerate(pd.qpts):
-                if np.isclose(q, [0, 0, 0]).all():
-                    gamma_i = i
-                    break
-
-            if gamma_i is None:
+            gamma_i = np.flatnonzero(np.isclose(pd.qpts, 0).all(axis=1))
+            if gamma_i.size == 0:
                 raise CastepError(
                     "Could not find gamma point phonons in" " CASTEP phonon file"
                 )
+            gamma_i = gamma_i[0]
 
-            atoms.info["ph_evals"] = evals[gamma_i]
-            atoms.info["ph_evecs"] = evecs[gamma_i]
+            # Get phonon frequencies+modes
+            atoms.info["ph_evals"] = np.array(pd.frequencies.magnitude[gamma_i])
+            atoms.info["ph_evecs"] = np.array(pd.eigenvectors[gamma_i])
 
         except IndexError:
             raise IOError(
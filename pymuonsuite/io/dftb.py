@@ -88,6 +88,13 @@ class ReadWriteDFTB(ReadWrite):
         |   folder (str) :          path to a directory to load DFTB+ results
         |   sname (str):            name to label the atoms with and/or of the
         |                           .phonons.pkl file to be read
+        |   read_phonons (bool):    if True, read the gamma point phonons
+        |                           from the .phonons.pkl file. Files saved by
+        |                           pm-asephonons (see write_dftb_phonons)
+        |                           keep the frequencies and modes in
+        |                           <sname>.phonons.frequencies.npy and
+        |                           <sname>.phonons.modes.npy, which must be
+        |                           in the same folder as the .pkl file
         |   Returns:
         |   atoms (ase.Atoms):      an atomic structure with the results
         |                           attached in a SinglePointCalculator
@@ -183,23 +190,39 @@ class ReadWriteDFTB(ReadWrite):
     def _read_dftb_phonons(self, atoms, phonon_source_file):
         with open(phonon_source_file, "rb") as f:
             phdata = pickle.load(f)
-            # Find the gamma point
-            gamma_i = None
-            for i, p in enumerate(phdata.path):
-                if (p == 0).all():
-                    gamma_i = i
-                    break
-            try:
-                ph_evals = phdata.frequencies[gamma_i]
-                ph_evecs = phdata.modes[gamma_i]
-                atoms.info["ph_evals"] = ph_evals
-                atoms.info["ph_evecs"] = ph_evecs
-            except TypeError:
-                raise RuntimeError(
-                    ("Phonon file {0} does not contain gamma " "point data").format(
-                        phonon_source_file
+        frequencies = phdata.frequencies
+        modes = phdata.modes
+        if frequencies is None:
+            # Arrays stored separately by write_dftb_phonons; map them so
+            # that only the gamma point data is actually read from disk
+            array_files = [
+                _phonon_array_file(phonon_source_file, name)
+                for name in ("frequencies", "modes")
+            ]
+            for array_file in array_files:
+                if not os.path.isfile(array_file):
+                    raise RuntimeError(
+                        "Phonon array file {0} not found: it must be in the "
+                        "same folder as {1}".format(array_file, phonon_source_file)
                     )
+            frequencies, modes = [np.load(f, mmap_mode="r") for f in array_files]
+        # Find the gamma point
+        gamma_i = None
+        for i, p in enumerate(phdata.path):
+            if (p == 0).all():
+                gamma_i = i
+                break
+        try:
+            ph_evals = frequencies[gamma_i]
+            ph_evecs = modes[gamma_i]
+            atoms.info["ph_evals"] = ph_evals
+            atoms.info["ph_evecs"] = ph_evecs
+        except TypeError:
+            raise RuntimeError(
+                ("Phonon file {0} does not contain gamma " "point data").format(
+                    phonon_source_file
                 )
+            )
 
     def write(self, a, folder, sname=None, calc_type="GEOM_OPT"):
         """Writes input files for an Atoms object with a Dftb+
@@ -358,6 +381,39 @@ class ReadWriteDFTB(ReadWrite):
         return self._calc
 
 
+def _phonon_array_file(phonon_file, name):
+    # e.g. seed.phonons.pkl -> seed.phonons.modes.npy
+    return "{0}.{1}.npy".format(os.path.splitext(phonon_file)[0], name)
+
+
+def write_dftb_phonons(phdata, phonon_file):
+    """Save ASE phonon data to a .phonons.pkl file.
+
+    The frequencies and modes are written as .npy files next to it, so that
+    ReadWriteDFTB can memory-map them; the pickle itself only keeps the
+    k-point path and the optimised structure. For seed.phonons.pkl these
+    are seed.phonons.frequencies.npy and seed.phonons.modes.npy, and all
+    three files must be kept together.
+
+    | Args:
+    |   phdata (ASEPhononData): Phonon data, as returned by ase_phonon_calc
+    |   phonon_file (str):      Path of the .phonons.pkl file to write
+    |
+    | Returns:
+    |   files ([str]):          Paths of all the files written
+    """
+
+    np.save(_phonon_array_file(phonon_file, "frequencies"), phdata.frequencies)
+    np.save(_phonon_array_file(phonon_file, "modes"), phdata.modes)
+
+    with open(phonon_file, "wb") as f:
+        pickle.dump(phdata._replace(frequencies=None, modes=None), f)
+
+    return [phonon_file] + [
+        _phonon_array_file(phonon_file, name) for name in ("frequencies", "modes")
+    ]
+
+
 def parse_spinpol_dftb(folder):
     """Parse atomic spin populations from a detailed.out DFTB+ file."""
 
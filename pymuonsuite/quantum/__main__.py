@@ -5,21 +5,10 @@ Author: Adam Laverack
 
 import os
 import sys
-import pickle
 import argparse as ap
 
-from pymuonsuite.quantum.vibrational.phonons import ase_phonon_calc
-from pymuonsuite.quantum.vibrational.average import (
-    muon_vibrational_average_write,
-    muon_vibrational_average_read,
-)
-from pymuonsuite.schemas import (
-    load_input_file,
-    MuonHarmonicSchema,
-    AsePhononsSchema,
-)
-from pymuonsuite.io.output import write_phonon_report
-from soprano.utils import silence_stdio
+# The heavier imports are done within the entry points, once the arguments
+# have been parsed, to keep the command line interface responsive
 
 
 def nq_entry():
@@ -48,6 +37,8 @@ def nq_entry():
 
     args = parser.parse_args()
 
+    from pymuonsuite.schemas import load_input_file, MuonHarmonicSchema
+
     # Load parameters
     params = load_input_file(args.parameter_file, MuonHarmonicSchema)
 
@@ -56,11 +47,19 @@ def nq_entry():
         params["average_T"] = params["displace_T"]
 
     if args.task == "w":
+        from pymuonsuite.quantum.vibrational.average import (
+            muon_vibrational_average_write,
+        )
+
         try:
             muon_vibrational_average_write(args.structure, **params)
         except IOError as e:
             print(e)
     else:
+        from pymuonsuite.quantum.vibrational.average import (
+            muon_vibrational_average_read,
+        )
+
         try:
             muon_vibrational_average_read(args.structure, **params)
         except IOError as e:
@@ -76,7 +75,12 @@ def asephonons_entry():
 
     from ase import io
     from ase.calculators.dftb import Dftb
+    from soprano.utils import silence_stdio
     from pymuonsuite.data.dftb_pars import DFTBArgs
+    from pymuonsuite.io.dftb import write_dftb_phonons
+    from pymuonsuite.io.output import write_phonon_report
+    from pymuonsuite.quantum.vibrational.phonons import ase_phonon_calc
+    from pymuonsuite.schemas import load_input_file, AsePhononsSchema
 
     parser = ap.ArgumentParser(
         description="Compute phonon modes with ASE and"
@@ -140,7 +144,11 @@ def asephonons_entry():
 
     # And write out the phonons
     outf = params["name"] + "_opt.phonons.pkl"
-    pickle.dump(phdata, open(outf, "wb"))
+    phfiles = write_dftb_phonons(phdata, outf)
+    print(
+        "Phonons written to {0}; keep these files together, and use {1} as "
+        "phonon_source_file in pm-nq.".format(", ".join(phfiles), outf)
+    )
     write_phonon_report(args, params, phdata)
 
 
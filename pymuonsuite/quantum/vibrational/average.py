@@ -6,7 +6,9 @@ Quantum vibrational averages
 
 
 import os
+import pickle
 import numpy as np
+from concurrent.futures import ThreadPoolExecutor
 
 from ase import io
 from soprano.utils import seedname
@@ -27,6 +29,46 @@ class MuonAverageError(Exception):
     pass
 
 
+def _load_displaced_tree(path, read_func, opt_args=None, max_workers=32):
+    """Load an AtomsCollection saved with save_tree, reading the structures
+    concurrently.
+
+    Equivalent to AtomsCollection.load_tree with safety_check=2: the folder
+    must contain a valid .collection file, only the subfolders listed in it
+    are loaded, and its info and arrays are restored. Any structure that
+    can't be read raises an error.
+    """
+
+    if opt_args is None:
+        opt_args = {}
+
+    check = AtomsCollection.check_tree(path)
+    if check == -1:
+        raise IOError("Folder {0} does not exist".format(path))
+    elif check == 2:
+        raise IOError("Folder {0} is not a valid collection tree".format(path))
+
+    with open(os.path.join(path, ".collection"), "rb") as f:
+        coll = pickle.load(f)
+    dirlist = coll["dirlist"]
+
+    def read_one(d):
+        return read_func(os.path.join(path, d), **opt_args)
+
+    max_workers = max(1, min(max_workers, len(dirlist)))
+    # The readers silence stdio themselves, which isn't thread safe: make
+    # sure the original streams are the ones restored at the end
+    with silence_stdio():
+        with ThreadPoolExecutor(max_workers=max_workers) as ex:
+            structures = list(ex.map(read_one, dirlist))
+
+    loaded_coll = AtomsCollection(structures, info=coll["info"])
+    for k, a in coll["arrays"].items():
+        loaded_coll.set_array(k, a)
+
+    return loaded_coll
+
+
 def muon_vibrational_average_write(
     structure,
     method="independent",
@@ -90,9 +132,9 @@ def muon_vibrational_average_write(
     elif len(mu_indices) == 1:
         mu_index = mu_indices[0]
     else:
-        species = list(species)
+        # Widen the string type if needed, so that the symbol isn't truncated
+        species = species.astype(np.result_type(species, np.array(mu_symbol)))
         species[mu_index] = mu_symbol
-        species = np.array(species)
 
     cell.set_array("castep_custom_species", species)
 
@@ -143,19 +185,24 @@ def muon_vibrational_average_write(
     displsch.recalc_displacements(n=grid_n, T=displace_T)
 
     # Make it a collection
-    pos = cell.get_positions()
+    all_pos = cell.get_positions()[None] + displsch.displacements
     displaced_cells = []
-    for i, d in enumerate(displsch.displacements):
+    for i, dpos in enumerate(all_pos):
         dcell = cell.copy()
-        dcell.set_positions(pos + d)
+        dcell.set_positions(dpos)
         if calculator == "dftb" and not kwargs["dftb_pbc"]:
             dcell.set_pbc(False)
         dcell.info["name"] = sname + "_displaced_{0}".format(i)
         displaced_cells.append(dcell)
 
     if kwargs["write_allconf"]:
-        # Write a global configuration structure
-        allconf = sum(displaced_cells, cell.copy())
+        # Write a global configuration structure. The displaced cells are
+        # copies of cell, so their arrays can be concatenated in one go
+        allconf = cell.copy()
+        for name, arr in cell.arrays.items():
+            allconf.arrays[name] = np.concatenate(
+                [arr] + [dcell.arrays[name] for dcell in displaced_cells]
+            )
         with silence_stdio():
             if all(allconf.get_pbc()):
                 io.write(sname + "_allconf.cell", allconf)
@@ -205,11 +252,10 @@ def muon_vibrational_average_read(
     io_formats = {"castep": ReadWriteCastep, "dftb+": ReadWriteDFTB}
 
     try:
-        displaced_coll = AtomsCollection.load_tree(
+        displaced_coll = _load_displaced_tree(
             sname + "_displaced",
             io_formats[calculator]().read,
             opt_args={"read_magres": True},
-            safety_check=2,
         )
     except Exception:
         raise
@@ -218,25 +264,28 @@ def muon_vibrational_average_read(
     mu_i = displaced_coll.info["muon_index"]
     displsch = displaced_coll.info["displacement_scheme"]
 
-    to_avg = []
+    N = len(displaced_coll)
+    to_avg = None
 
-    for a in displaced_coll:
+    for i, a in enumerate(displaced_coll):
         if avgprop == "hyperfine":
-            to_avg.append(a.get_array("hyperfine")[mu_i])
+            val = a.get_array("hyperfine")[mu_i]
         elif avgprop == "charge":
             # Used mostly as test
             try:
-                to_avg.append(a.get_charges()[mu_i])
+                val = a.get_charges()[mu_i]
             except RuntimeError:
                 raise (IOError("Could not read charges."))
+        if to_avg is None:
+            # Allocate once we know the shape of the property
+            to_avg = np.empty((N,) + np.shape(val))
+        to_avg[i] = val
 
-    to_avg = np.array(to_avg)
     displsch.recalc_weights(T=average_T)
-    # New shape
-    N = len(displaced_coll)
-    shape = tuple([slice(N)] + [None] * (len(to_avg.shape) - 1))
-    weights = displsch.weights[shape]
-    avg = np.sum(weights * to_avg, axis=0)
+    weights = displsch.weights
+    # Weighted sum over the first axis, whatever the shape of the property.
+    # Flattening the values makes it a single BLAS matrix-vector product
+    avg = (weights[:N] @ to_avg.reshape(N, -1)).reshape(to_avg.shape[1:])
 
     # Print output report
     with open(average_file, "w") as f:
@@ -254,20 +303,16 @@ Averaged value:
 
 All values, by configuration:
 
-{vals}
-
-        """.format(
+""".format(
                 property=avgname,
                 cell=structure,
                 scheme=displsch,
                 avg=avg,
-                vals="\n".join(
-                    [
-                        "Conf: {0} (Weight = {1})\n{2}\n".format(
-                            i, displsch.weights[i], v
-                        )
-                        for i, v in enumerate(to_avg)
-                    ]
-                ),
             )
         )
+        # One configuration at a time, rather than joining them all first
+        for i, v in enumerate(to_avg):
+            if i > 0:
+                f.write("\n")
+            f.write("Conf: {0} (Weight = {1})\n{2}\n".format(i, weights[i], v))
+        f.write("\n\n        ")
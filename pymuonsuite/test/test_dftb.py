@@ -3,13 +3,17 @@
 import unittest
 
 import os
+import pickle
 import shutil
 
+import numpy as np
+
 from ase import io
 from ase.calculators.dftb import Dftb
 
 from pymuonsuite.data.dftb_pars import DFTBArgs
-from pymuonsuite.io.dftb import ReadWriteDFTB
+from pymuonsuite.data.dftb_pars.dftb_pars import parameter_sets
+from pymuonsuite.io.dftb import ReadWriteDFTB, write_dftb_phonons
 
 
 _TEST_DIR = os.path.dirname(os.path.abspath(__file__))
@@ -51,6 +55,36 @@ class TestReadWriteDFTB(unittest.TestCase):
         self.assertIn("ph_evecs", atoms2.info.keys())
         self.assertIn("ph_evals", atoms2.info.keys())
 
+    def test_phonons(self):
+        # Tests that phonons saved with write_dftb_phonons are read back
+        # the same as those from a plain pickled file.
+        folder = os.path.join(_TESTDATA_DIR, "ethyleneMu/dftb-phonons")
+        output_folder = os.path.join(_TESTDATA_DIR, "test_save_phonons")
+        try:
+            os.mkdir(output_folder)
+            shutil.copy(os.path.join(folder, "geo_end.gen"), output_folder)
+            with open(os.path.join(folder, "ethyleneMu_opt.phonons.pkl"), "rb") as f:
+                phdata = pickle.load(f)
+            write_dftb_phonons(
+                phdata, os.path.join(output_folder, "ethyleneMu_opt.phonons.pkl")
+            )
+
+            reader = ReadWriteDFTB()
+            atoms = reader.read(folder, "ethyleneMu_opt", read_phonons=True)
+            atoms_mm = reader.read(output_folder, "ethyleneMu_opt", read_phonons=True)
+            self.assertTrue(np.all(atoms.info["ph_evals"] == atoms_mm.info["ph_evals"]))
+            self.assertTrue(np.all(atoms.info["ph_evecs"] == atoms_mm.info["ph_evecs"]))
+
+            # Without its modes file, the .pkl alone can't be read
+            modes_file = os.path.join(output_folder, "ethyleneMu_opt.phonons.modes.npy")
+            os.remove(modes_file)
+            with self.assertRaises(IOError) as e:
+                reader.read(output_folder, "ethyleneMu_opt", read_phonons=True)
+            self.assertIn(modes_file, str(e.exception))
+            self.assertIn("same folder", str(e.exception))
+        finally:
+            shutil.rmtree(output_folder)
+
     def test_create_calc(self):
         # Tests whether the correct values of the parameters are set
         # when creating a calculator that would be used for writing
@@ -175,6 +209,26 @@ class TestReadWriteDFTB(unittest.TestCase):
             shutil.rmtree(output_folder)
 
 
+class TestDFTBArgs(unittest.TestCase):
+    def test_parameter_sets(self):
+        # Only the parametrisation folders should be listed
+        self.assertEqual(sorted(parameter_sets), ["3ob-3-1", "pbc-0-3"])
+        self.assertNotIn("__pycache__", parameter_sets)
+        with self.assertRaises(KeyError):
+            DFTBArgs("not-a-set")
+
+        dargs = DFTBArgs("3ob-3-1")
+        prefix = dargs.args["Hamiltonian_SlaterKosterFiles_Prefix"]
+        self.assertTrue(os.path.isdir(prefix))
+        self.assertEqual(dargs.args["Hamiltonian_SCC"], "Yes")
+        self.assertNotIn("Hamiltonian_SpinPolarisation", dargs.args)
+
+        # Enabling an optional file must not leak into the shared defaults
+        dargs.set_optional("spinpol.json", True)
+        self.assertIn("Hamiltonian_SpinPolarisation", dargs.args)
+        self.assertNotIn("Hamiltonian_SpinPolarisation", DFTBArgs("3ob-3-1").args)
+
+
 if __name__ == "__main__":
 
     unittest.main()
@@ -4,10 +4,16 @@ import unittest
 
 import os
 import sys
+import pickle
 import shutil
 import subprocess
 
+import numpy as np
+from soprano.collection import AtomsCollection
+
+from pymuonsuite.io.dftb import ReadWriteDFTB
 from pymuonsuite.quantum.__main__ import asephonons_entry, nq_entry
+from pymuonsuite.quantum.vibrational.average import _load_displaced_tree
 
 
 _TEST_DIR = os.path.dirname(os.path.abspath(__file__))
@@ -67,6 +73,57 @@ class TestQuantum(unittest.TestCase):
         os.remove("ethyleneMu_opt_allconf.xyz")
         shutil.rmtree("ethyleneMu_opt_displaced")
 
+    def test_load_displaced_tree(self):
+        # The concurrent loader must give the same collection as soprano's.
+        # Work on a copy with an extra collection array, to check those too
+        path = os.path.join(_TESTDATA_DIR, "test_load_displaced_tree")
+        shutil.copytree(
+            os.path.join(_TESTDATA_DIR, "dftb-nq-results", "ethyleneMu_opt_displaced"),
+            path,
+        )
+        self.addCleanup(shutil.rmtree, path)
+        with open(os.path.join(path, ".collection"), "rb") as f:
+            coll_data = pickle.load(f)
+        coll_data["arrays"]["conf_index"] = np.arange(len(coll_data["dirlist"]))
+        with open(os.path.join(path, ".collection"), "wb") as f:
+            pickle.dump(coll_data, f)
+
+        read_func = ReadWriteDFTB().read
+        opt_args = {"read_magres": True}
+        ref_coll = AtomsCollection.load_tree(
+            path, read_func, opt_args=opt_args, safety_check=2
+        )
+        coll = _load_displaced_tree(path, read_func, opt_args=opt_args)
+
+        self.assertEqual(len(coll), len(ref_coll))
+        for a, ref_a in zip(coll, ref_coll):
+            self.assertEqual(a.info["name"], ref_a.info["name"])
+            self.assertTrue(np.all(a.get_positions() == ref_a.get_positions()))
+            self.assertTrue(np.all(a.get_charges() == ref_a.get_charges()))
+
+        self.assertEqual(sorted(coll.info), sorted(ref_coll.info))
+        self.assertEqual(coll.info["muon_index"], ref_coll.info["muon_index"])
+        displsch = coll.info["displacement_scheme"]
+        ref_displsch = ref_coll.info["displacement_scheme"]
+        self.assertTrue(np.all(displsch.displacements == ref_displsch.displacements))
+        displsch.recalc_weights()
+        ref_displsch.recalc_weights()
+        self.assertTrue(np.all(displsch.weights == ref_displsch.weights))
+
+        # AtomsCollection has no public way to list its arrays
+        self.assertIn("conf_index", ref_coll._arrays)
+        self.assertEqual(sorted(coll._arrays), sorted(ref_coll._arrays))
+        for k in ref_coll._arrays:
+            self.assertTrue(np.all(coll.get_array(k) == ref_coll.get_array(k)))
+
+        # A folder without a .collection file is not a valid tree
+        with self.assertRaises(IOError):
+            _load_displaced_tree(
+                os.path.join(path, "ethyleneMu_opt_displaced_0"), read_func
+            )
+        with self.assertRaises(IOError):
+            _load_displaced_tree(os.path.join(path, "missing"), read_func)
+
 
 if __name__ == "__main__":
 